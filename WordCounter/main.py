@@ -1,93 +1,524 @@
 import re
 import os
-from collections import Counter, defaultdict
+import stat
+import sys
+import io
+import mmap
+import codecs
+import contextlib
+from collections import Counter, OrderedDict, defaultdict
 from pathlib import Path
 import json
+import string
+import heapq
+import hashlib
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to Counter-based statistics
+    np = None
+
+try:
+    from numba import njit, types
+    from numba.typed import Dict
+except ImportError:  # Numba is optional; fall back to the pure-Python tokenizer
+    njit = None
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_ASCII_DIGITS = frozenset(string.digits)
+# ASCII characters that str.isspace() accepts, for stripping ASCII bytes
+_ASCII_SPACE_BYTES = bytes(c for c in range(128) if chr(c).isspace())
+_ASCII_SPACE_CODES = list(_ASCII_SPACE_BYTES)
+
+# Characters read per chunk when streaming a file
+_CHUNK_SIZE = 4 * 1024 * 1024
+# Trailing characters searched for a cut point in a whitespace-free chunk
+_CUT_WINDOW = 256
+# Number of analyze_text results remembered per WordCounter
+_ANALYSIS_CACHE_SIZE = 16
+
+_RE_WORD = re.compile(r'[a-zA-Z]+')
+_RE_WORD_BYTES = re.compile(rb'[a-zA-Z]+')
+
+
+class _CleanTable(dict):
+    """str.translate table mapping every non-ASCII-letter character to a space."""
+
+    def __missing__(self, codepoint):
+        # Only the 128 ASCII entries are stored; everything else is a space
+        return ' '
+
+
+_CLEAN_TABLE = _CleanTable(
+    (c, c if chr(c) in _ASCII_LETTERS else ' ') for c in range(128)
+)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _fold_ascii(buf):
+        """Lowercase A-Z and flag letters in one branch-free pass over buf.
+
+        The loop body has no data-dependent branches, so LLVM vectorizes it
+        (AVX2, NEON, ...) and classifies a full SIMD register of bytes at once.
+        """
+        n = buf.size
+        folded = np.empty(n, dtype=np.uint8)
+        is_letter = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            c = buf[i] | np.uint8(0x20)
+            folded[i] = c
+            is_letter[i] = (c >= np.uint8(0x61)) & (c <= np.uint8(0x7A))
+        return folded, is_letter
+
+    @njit(cache=True)
+    def _grow(arr):
+        """Return a copy of arr with twice the capacity."""
+        grown = np.empty(arr.size * 2, dtype=arr.dtype)
+        grown[:arr.size] = arr
+        return grown
+
+    @njit(cache=True)
+    def _fast_tokenize_count(buf):
+        """Count the ASCII words in a uint8 buffer, case-insensitively.
+
+        Returns (starts, lengths, counts) for each distinct word in order of
+        first occurrence. Words are hashed with FNV-1a into a typed Dict and
+        collisions are resolved by comparing against the first occurrence.
+        """
+        folded, is_letter = _fold_ascii(buf)
+        n = buf.size
+        slots = Dict.empty(key_type=types.uint64, value_type=types.int64)
+        # Sized for distinct words, not for n, and doubled as needed
+        starts = np.empty(1024, dtype=np.int64)
+        lengths = np.empty(1024, dtype=np.int64)
+        counts = np.empty(1024, dtype=np.int64)
+        n_words = 0
+        i = 0
+        while i < n:
+            if not is_letter[i]:
+                i += 1
+                continue
+            start = i
+            h = np.uint64(14695981039346656037)
+            while i < n and is_letter[i]:
+                h = (h ^ np.uint64(folded[i])) * np.uint64(1099511628211)
+                i += 1
+            length = i - start
+            while True:
+                if h not in slots:
+                    if n_words == starts.size:
+                        starts = _grow(starts)
+                        lengths = _grow(lengths)
+                        counts = _grow(counts)
+                    slots[h] = n_words
+                    starts[n_words] = start
+                    lengths[n_words] = length
+                    counts[n_words] = 1
+                    n_words += 1
+                    break
+                slot = slots[h]
+                if lengths[slot] == length:
+                    other = starts[slot]
+                    same = True
+                    for k in range(length):
+                        if folded[other + k] != folded[start + k]:
+                            same = False
+                            break
+                    if same:
+                        counts[slot] += 1
+                        break
+                h += np.uint64(1)
+        return starts[:n_words], lengths[:n_words], counts[:n_words]
+else:
+    _fast_tokenize_count = None
+
+
+def _as_text(data):
+    """Return a bytes chunk unchanged if it is ASCII, otherwise decoded to str."""
+    return data if data.isascii() else data.decode('utf-8')
+
+
+def _ascii_array(text):
+    """Return text as a uint8 array if it is ASCII bytes or str, otherwise None."""
+    if not text.isascii():
+        return None
+    if isinstance(text, str):
+        text = text.encode('ascii')
+    return np.frombuffer(text, dtype=np.uint8)
+
+
+def _count_words(text):
+    """Return a Counter of the lowercased words in a str or ASCII bytes."""
+    buf = _ascii_array(text) if _fast_tokenize_count is not None else None
+    if buf is not None:
+        starts, lengths, counts = _fast_tokenize_count(buf)
+        word_freq = {
+            text[start:start + length].lower(): count
+            for start, length, count in zip(starts.tolist(), lengths.tolist(), counts.tolist())
+        }
+    else:
+        word_re = _RE_WORD if isinstance(text, str) else _RE_WORD_BYTES
+        word_freq = Counter(word_re.findall(text.lower()))
+
+    if isinstance(text, bytes):
+        # Only the distinct words are decoded, never the whole input
+        word_freq = {word.decode('ascii'): n for word, n in word_freq.items()}
+    return Counter(word_freq)
+
+
+def _split_sentences(text):
+    """Split a str or bytes on '.', '!' and '?'.
+
+    Unlike re.split(r'[.!?]+') a run of terminators leaves empty pieces
+    between them, which is harmless since blank pieces are never counted.
+    """
+    if isinstance(text, bytes):
+        return text.replace(b'!', b'.').replace(b'?', b'.').split(b'.')
+    return text.replace('!', '.').replace('?', '.').split('.')
+
+
+def _count_segments(pieces, whitespace, pending):
+    """Count the non-blank segments among the pieces of a split chunk.
+
+    pieces may be any iterable, so it is walked once and never copied.
+    pending tells whether the segment left open by the previous chunk has
+    content; the first piece continues it. The last piece stays open for the
+    next chunk. Returns (closed segment count, new pending flag).
+    """
+    pieces = iter(pieces)
+    first = next(pieces)
+    pending = pending or bool(first.strip(whitespace))
+    count = 0
+    for piece in pieces:
+        count += pending
+        pending = bool(piece.strip(whitespace))
+    return count, pending
+
+
+class _TextReader:
+    """Minimal read()-only view of an in-memory str or bytes-like, for _iter_chunks.
+
+    Bytes-like input is read through a memoryview, so only the chunk being
+    returned is ever copied out of it, as bytes.
+    """
+
+    def __init__(self, text):
+        self._text = text if isinstance(text, str) else memoryview(text).cast('B')
+        self._pos = 0
+
+    def read(self, size):
+        chunk = self._text[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        return chunk if isinstance(chunk, str) else chunk.tobytes()
+
+
+def _can_cut_between(before, after):
+    """Tell whether text may be split into chunks between two characters.
+
+    A cut must not follow a line break, which may start a paragraph break
+    or be half of a CRLF, nor join two characters whose lowercase forms run
+    together into one word (this includes non-ASCII characters such as 'İ'
+    whose lowercase form starts with an ASCII letter).
+    """
+    if before in '\r\n':
+        return False
+    return not (before.lower()[-1:] in _ASCII_LETTERS and after.lower()[:1] in _ASCII_LETTERS)
+
+
+def _whitespace_free_cut(data):
+    """Return the length of the head of a whitespace-free str or bytes to emit.
+
+    Only the last _CUT_WINDOW units are decoded and searched. For bytes the
+    cut always falls between whole UTF-8 characters. Returns 0 when no cut
+    point is found, leaving everything to the next chunk.
+    """
+    start = max(0, len(data) - _CUT_WINDOW)
+    if isinstance(data, str):
+        tail = data[start:]
+    else:
+        while start and data[start] & 0xC0 == 0x80:
+            start -= 1
+        # An incremental decoder leaves a trailing partial character out
+        tail = codecs.getincrementaldecoder('utf-8')().decode(data[start:])
+    for i in range(len(tail) - 1, 0, -1):
+        if _can_cut_between(tail[i - 1], tail[i]):
+            if isinstance(data, str):
+                return start + i
+            return start + len(tail[:i].encode('utf-8'))
+    return 0
+
+
+def _iter_chunks(file, size=_CHUNK_SIZE):
+    """Yield the contents of a file, mmap or _TextReader in chunks of roughly size units.
+
+    Chunks are cut where a whitespace run starts, so no word and no
+    paragraph break is ever split between two chunks. Input without
+    whitespace is cut near its end, between two whole characters that do not
+    belong to one word or line break, so the carry-over stays small.
+    """
+    carry = file.read(0)
+    while True:
+        data = file.read(size)
+        if not data:
+            break
+        data = carry + data
+        if data[-1:].isspace():
+            head = data.rstrip()
+        else:
+            parts = data.rsplit(None, 1)
+            if len(parts) == 2:
+                head = parts[0]
+            else:
+                head = data[:_whitespace_free_cut(data)]
+        carry = data[len(head):]
+        if head:
+            yield head
+    if carry:
+        yield carry
+
+
+def _text_digest(text):
+    """Return a (length, BLAKE2b digest) fingerprint of a str or bytes-like text.
+
+    str input is hashed as UTF-8 a chunk at a time, so it is never encoded
+    as a whole; equal text gives the same fingerprint whichever type it has.
+    """
+    digest = hashlib.blake2b()
+    if isinstance(text, str):
+        for start in range(0, len(text), _CHUNK_SIZE):
+            digest.update(text[start:start + _CHUNK_SIZE].encode('utf-8', 'surrogatepass'))
+    else:
+        digest.update(text)
+    return len(text), digest.digest()
+
+
+def _map_file(file):
+    """Return a read-only mmap of a binary file, or the file itself.
+
+    Only regular, non-empty files are mapped; pipes, procfs entries (which
+    report a size of 0) and files mmap refuses are streamed from the file
+    object instead. Either way the result is a context manager with read().
+    """
+    st = os.fstat(file.fileno())
+    if stat.S_ISREG(st.st_mode) and st.st_size:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            pass
+        else:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return mapped
+    return contextlib.nullcontext(file)
+
+
+def _decode_chunk(chunk):
+    """Turn a raw UTF-8 file chunk into what text-mode reading would give.
+
+    Newlines are translated like universal newlines mode; ASCII chunks stay
+    bytes and anything else is decoded to str.
+    """
+    if b'\r' in chunk:
+        chunk = chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return _as_text(chunk)
+
+
+class AnalysisResult(dict):
+    """Analysis statistics whose 'most_common_words' entry is built on first access.
+
+    The top-10 list is only computed when it is actually looked up, so
+    callers that just need totals or averages never pay for it.
+    """
+
+    def __missing__(self, key):
+        if key != 'most_common_words':
+            raise KeyError(key)
+        value = heapq.nlargest(10, self['word_frequency'].items(), key=itemgetter(1))
+        self[key] = value
+        return value
+
+
+class _TextStats:
+    """Running totals for text that is analyzed in one or more chunks."""
+
+    def __init__(self, counter):
+        self.counter = counter
+        self.word_freq = Counter()
+        self.char_stats = Counter(counter.count_characters(''))
+        self.sentence_count = 0
+        self.paragraph_count = 0
+        self._open_sentence = False
+        self._open_paragraph = False
+
+    def feed(self, text):
+        """Add a str or ASCII bytes chunk to the totals."""
+        if isinstance(text, bytes):
+            whitespace, paragraph_sep = _ASCII_SPACE_BYTES, b'\n\n'
+        else:
+            whitespace, paragraph_sep = None, '\n\n'
+
+        count, self._open_sentence = _count_segments(
+            _split_sentences(text), whitespace, self._open_sentence)
+        self.sentence_count += count
+        count, self._open_paragraph = _count_segments(
+            text.split(paragraph_sep), whitespace, self._open_paragraph)
+        self.paragraph_count += count
+
+        self.word_freq.update(_count_words(text))
+        self.char_stats.update(self.counter.count_characters(text))
+
+    def result(self, include_stop_words=True):
+        """Finish the analysis and return its statistics."""
+        sentence_count = self.sentence_count + self._open_sentence
+        paragraph_count = self.paragraph_count + self._open_paragraph
+
+        # Word frequency analysis; stop words are dropped from the counts
+        # rather than filtered out of the token list one by one
+        word_freq = self.word_freq
+        if not include_stop_words:
+            for stop_word in self.counter.stop_words:
+                word_freq.pop(stop_word, None)
+        word_count = sum(word_freq.values())
+
+        # Calculate averages
+        avg_word_length = sum(len(word) * n for word, n in word_freq.items()) / word_count if word_count else 0
+        avg_sentence_length = word_count / sentence_count if sentence_count else 0
+
+        # Reading time estimate (average 200 words per minute)
+        reading_time_minutes = word_count / 200
+
+        return AnalysisResult({
+            'word_count': word_count,
+            'unique_words': len(word_freq),
+            'sentence_count': sentence_count,
+            'paragraph_count': paragraph_count,
+            'character_stats': dict(self.char_stats),
+            'word_frequency': word_freq,
+            'avg_word_length': round(avg_word_length, 2),
+            'avg_sentence_length': round(avg_sentence_length, 2),
+            'reading_time_minutes': round(reading_time_minutes, 2),
+        })
 
 
 class WordCounter:
+    # Default stop words, shared by all instances instead of being rebuilt in
+    # __init__; assign self.stop_words to customise them per instance
+    STOP_WORDS = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+        'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+        'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
+        'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
+    })
+    stop_words = STOP_WORDS
+
     def __init__(self):
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
-            'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
-            'her', 'us', 'them', 'my', 'your', 'his', 'its', 'our', 'their'
-        }
+        self._cache = OrderedDict()
 
     def clean_text(self, text):
         """Clean and normalize text for analysis."""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove punctuation and special characters, keep only letters and spaces
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Lowercase, replace punctuation and special characters with spaces,
+        # then collapse runs of whitespace into a single space
+        return ' '.join(text.lower().translate(_CLEAN_TABLE).split())
 
     def extract_words(self, text, include_stop_words=True):
         """Extract words from text."""
-        cleaned_text = self.clean_text(text)
-        words = cleaned_text.split()
+        # Runs of letters in the lowercased text are exactly the words that
+        # clean_text() would leave behind, without building the cleaned string
+        words = _RE_WORD.findall(text.lower())
 
         if not include_stop_words:
             words = [word for word in words if word not in self.stop_words]
 
-        return [word for word in words if word]  # Remove empty strings
+        return words
 
     def count_characters(self, text):
         """Count characters in text."""
+        total_chars = len(text)
+        buf = _ascii_array(text) if np is not None else None
+        if buf is not None:
+            # ASCII only: a 128-bin byte histogram covers every statistic
+            hist = np.bincount(buf, minlength=128)
+            spaces = int(hist[0x20])
+            alphabetic = int(hist[0x41:0x5B].sum() + hist[0x61:0x7B].sum())
+            numeric = int(hist[0x30:0x3A].sum())
+            whitespace = int(hist[_ASCII_SPACE_CODES].sum())
+        else:
+            # One pass over the text; every statistic is derived from the histogram
+            char_freq = Counter(text)
+            if isinstance(text, bytes):
+                char_freq = {chr(byte): n for byte, n in char_freq.items()}
+            spaces = char_freq.get(' ', 0)
+            alphabetic = sum(n for char, n in char_freq.items() if char in _ASCII_LETTERS)
+            numeric = sum(n for char, n in char_freq.items() if char in _ASCII_DIGITS)
+            whitespace = sum(n for char, n in char_freq.items() if char.isspace())
+
         return {
-            'total_chars': len(text),
-            'chars_no_spaces': len(text.replace(' ', '')),
-            'alphabetic_chars': len(re.sub(r'[^a-zA-Z]', '', text)),
-            'numeric_chars': len(re.sub(r'[^0-9]', '', text)),
-            'spaces': text.count(' '),
-            'punctuation': len(re.sub(r'[a-zA-Z0-9\s]', '', text))
+            'total_chars': total_chars,
+            'chars_no_spaces': total_chars - spaces,
+            'alphabetic_chars': alphabetic,
+            'numeric_chars': numeric,
+            'spaces': spaces,
+            'punctuation': total_chars - alphabetic - numeric - whitespace
         }
 
     def analyze_text(self, text, include_stop_words=True):
-        """Perform comprehensive text analysis."""
-        words = self.extract_words(text, include_stop_words)
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        paragraphs = text.split('\n\n')
-        paragraphs = [p.strip() for p in paragraphs if p.strip()]
-
-        # Word frequency analysis
-        word_freq = Counter(words)
-
-        # Character analysis
-        char_stats = self.count_characters(text)
-
-        # Calculate averages
-        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
-        avg_sentence_length = len(words) / len(sentences) if sentences else 0
-
-        # Reading time estimate (average 200 words per minute)
-        reading_time_minutes = len(words) / 200
-
-        return {
-            'word_count': len(words),
-            'unique_words': len(word_freq),
-            'sentence_count': len(sentences),
-            'paragraph_count': len(paragraphs),
-            'character_stats': char_stats,
-            'word_frequency': word_freq,
-            'avg_word_length': round(avg_word_length, 2),
-            'avg_sentence_length': round(avg_sentence_length, 2),
-            'reading_time_minutes': round(reading_time_minutes, 2),
-            'most_common_words': word_freq.most_common(10)
-        }
+        """Perform comprehensive text analysis.
+
+        text may be a str or any bytes-like object holding UTF-8. Bytes-like
+        input is never copied or decoded as a whole: it is read in chunks, and
+        only chunks that are not ASCII are decoded.
+        """
+        # Repeated analyses of the same text are served from a small LRU cache
+        # keyed on a digest, so cached texts are not kept alive; the stop words
+        # in use are part of the key when they are filtered out
+        key = (*_text_digest(text), None if include_stop_words else frozenset(self.stop_words))
+        cached = self._cache.get(key)
+        if cached is None:
+            # Fed in chunks like a file, so the per-chunk split lists and
+            # copies stay bounded even for very large inputs
+            stats = _TextStats(self)
+            for chunk in _iter_chunks(_TextReader(text)):
+                stats.feed(chunk if isinstance(chunk, str) else _as_text(chunk))
+            analysis = stats.result(include_stop_words)
+
+            # A text is only stored the second time it is seen: one-off texts
+            # cost no copy, and a result handed out uncopied is never cached
+            if key not in self._cache:
+                self._cache[key] = None
+                if len(self._cache) > _ANALYSIS_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+                return analysis
+            cached = self._cache[key] = analysis
+        self._cache.move_to_end(key)
+
+        # Hand out fresh containers so callers cannot modify the cached entry
+        return AnalysisResult(
+            cached,
+            word_frequency=Counter(cached['word_frequency']),
+            character_stats=dict(cached['character_stats']),
+        )
 
     def analyze_file(self, file_path, include_stop_words=True):
-        """Analyze text file and return statistics."""
+        """Analyze text file and return statistics.
+
+        The file is read in chunks, memory-mapped when it is a regular file, so
+        memory use does not grow with its size and the data is never copied
+        into one big string. Pipes and procfs entries are streamed instead.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            stats = _TextStats(self)
+            with open(file_path, 'rb') as file:
+                with _map_file(file) as source:
+                    for chunk in _iter_chunks(source):
+                        stats.feed(_decode_chunk(chunk))
 
-            analysis = self.analyze_text(content, include_stop_words)
+            analysis = stats.result(include_stop_words)
             analysis['file_path'] = file_path
             analysis['file_size_bytes'] = os.path.getsize(file_path)
 
@@ -98,14 +529,36 @@ class WordCounter:
         except UnicodeDecodeError:
             raise UnicodeDecodeError("Unable to read file. Please ensure it's a text file with UTF-8 encoding.")
 
-    def compare_texts(self, text1, text2):
-        """Compare two texts and show differences."""
-        analysis1 = self.analyze_text(text1, include_stop_words=False)
-        analysis2 = self.analyze_text(text2, include_stop_words=False)
+    def analyze_files(self, file_paths, include_stop_words=True, workers=None):
+        """Analyze several text files in parallel and merge their word frequencies."""
+        file_paths = list(file_paths)
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(file_paths) // (4 * workers))
+
+        word_freq = Counter()
+        with ProcessPoolExecutor(workers) as executor:
+            analyze_one = partial(_analyze_one, include_stop_words=include_stop_words)
+            for file_freq in executor.map(analyze_one, file_paths, chunksize=chunksize):
+                word_freq += file_freq
 
-        # Find unique words in each text
-        words1 = set(analysis1['word_frequency'].keys())
-        words2 = set(analysis2['word_frequency'].keys())
+        return word_freq
+
+    def _word_set(self, text):
+        """Return the distinct non-stop words of text."""
+        return set(_RE_WORD.findall(text.lower())) - self.stop_words
+
+    def compare_texts(self, text1, text2, include_stats=True):
+        """Compare two texts and show differences."""
+        if include_stats:
+            analysis1 = self.analyze_text(text1, include_stop_words=False)
+            analysis2 = self.analyze_text(text2, include_stop_words=False)
+            words1 = set(analysis1['word_frequency'].keys())
+            words2 = set(analysis2['word_frequency'].keys())
+        else:
+            # Only the vocabularies are needed, so skip the full analysis
+            analysis1 = analysis2 = None
+            words1 = self._word_set(text1)
+            words2 = self._word_set(text2)
 
         unique_to_text1 = words1 - words2
         unique_to_text2 = words2 - words1
@@ -122,9 +575,10 @@ class WordCounter:
 
     def save_analysis(self, analysis, output_file):
         """Save analysis results to a file."""
-        # Convert Counter objects to regular dicts for JSON serialization
-        if 'word_frequency' in analysis:
-            analysis['word_frequency'] = dict(analysis['word_frequency'])
+        # Counter is a dict subclass, so json writes it as-is, chunk by chunk
+        if isinstance(analysis, AnalysisResult):
+            # Make sure the lazily computed top-10 list is part of the export
+            analysis = dict(analysis, most_common_words=analysis['most_common_words'])
 
         with open(output_file, 'w', encoding='utf-8') as file:
             json.dump(analysis, file, indent=2, ensure_ascii=False)
@@ -147,6 +601,36 @@ Machine learning and artificial intelligence are revolutionizing how we interact
         return filename
 
 
+def _analyze_one(file_path, include_stop_words=True):
+    """Return the word frequencies of one file; runs in a worker process."""
+    return WordCounter().analyze_file(file_path, include_stop_words)['word_frequency']
+
+
+def read_text_input(prompt):
+    """Read multi-line text from the console until two empty lines or end of input."""
+    print(f"\n{prompt} (press Enter twice to finish):")
+    text = io.StringIO()
+    blank_pending = False
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        if line == "\n":
+            if blank_pending:
+                break
+            # Only written once we know it is not the closing blank line
+            blank_pending = True
+            continue
+        if blank_pending:
+            text.write("\n")
+            blank_pending = False
+        text.write(line)
+
+    # Drop the newline that ends the last line, as the input() loop did
+    text = text.getvalue()
+    return text[:-1] if text.endswith("\n") else text
+
+
 def print_analysis_report(analysis):
     """Print a formatted analysis report."""
     print("\n" + "=" * 50)
@@ -200,15 +684,7 @@ def main():
 
         if choice == "1":
             # Analyze direct text input
-            print("\nEnter your text (press Enter twice to finish):")
-            lines = []
-            while True:
-                line = input()
-                if line == "" and lines and lines[-1] == "":
-                    break
-                lines.append(line)
-
-            text = "\n".join(lines[:-1])  # Remove the last empty line
+            text = read_text_input("Enter your text")
 
             if text.strip():
                 include_stop = input("\nInclude stop words in analysis? (y/N): ").lower() == 'y'
@@ -243,23 +719,8 @@ def main():
 
         elif choice == "3":
             # Compare two texts
-            print("\nEnter first text (press Enter twice to finish):")
-            lines1 = []
-            while True:
-                line = input()
-                if line == "" and lines1 and lines1[-1] == "":
-                    break
-                lines1.append(line)
-            text1 = "\n".join(lines1[:-1])
-
-            print("\nEnter second text (press Enter twice to finish):")
-            lines2 = []
-            while True:
-                line = input()
-                if line == "" and lines2 and lines2[-1] == "":
-                    break
-                lines2.append(line)
-            text2 = "\n".join(lines2[:-1])
+            text1 = read_text_input("Enter first text")
+            text2 = read_text_input("Enter second text")
 
             if text1.strip() and text2.strip():
                 comparison = counter.compare_texts(text1, text2)
@@ -0,0 +1,163 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+from main import WordCounter, _TextReader, _TextStats, _iter_chunks, read_text_input
+
+
+class IterChunksTest(unittest.TestCase):
+    def analyze_in_chunks(self, data, size):
+        counter = WordCounter()
+        stats = _TextStats(counter)
+        chunks = list(_iter_chunks(io.BytesIO(data), size))
+        for chunk in chunks:
+            stats.feed(chunk.decode('utf-8'))
+        return chunks, stats.result()
+
+    def test_whitespace_free_input_is_cut_into_small_chunks(self):
+        data = b'{"alpha":"beta","gamma":[1,2,3],"delta":"epsilon!"}' * 200
+        chunks, analysis = self.analyze_in_chunks(data, 64)
+
+        self.assertEqual(b''.join(chunks), data)
+        self.assertLess(max(len(chunk) for chunk in chunks), 128)
+        expected = WordCounter().analyze_text(data.decode('ascii'))
+        for key in ('word_count', 'sentence_count', 'paragraph_count', 'character_stats'):
+            self.assertEqual(analysis[key], expected[key])
+        self.assertEqual(analysis['word_frequency'], expected['word_frequency'])
+
+        data = '中文。abİc\u212a字'.encode('utf-8') * 200
+        chunks, analysis = self.analyze_in_chunks(data, 64)
+
+        self.assertEqual(b''.join(chunks), data)
+        self.assertLess(max(len(chunk) for chunk in chunks), 128)
+        expected = WordCounter().analyze_text(data.decode('utf-8'))
+        for key in ('word_count', 'sentence_count', 'paragraph_count', 'character_stats'):
+            self.assertEqual(analysis[key], expected[key])
+        self.assertEqual(analysis['word_frequency'], expected['word_frequency'])
+
+    def test_multibyte_characters_are_never_split(self):
+        data = 'ééé,жж.fooé;'.encode('utf-8') * 50
+        chunks, analysis = self.analyze_in_chunks(data, 5)
+
+        self.assertEqual(b''.join(chunks), data)
+        expected = WordCounter().analyze_text(data.decode('utf-8'))
+        self.assertEqual(analysis['word_frequency'], expected['word_frequency'])
+        self.assertEqual(analysis['character_stats'], expected['character_stats'])
+
+    def test_in_memory_text_chunks_match_whole_text(self):
+        text = 'First paragraph. Still first!\n\n\nSecond one?\r\n\nThird... ok' * 20
+        stats = _TextStats(WordCounter())
+        stats.feed(text)
+        expected = stats.result()
+
+        stats = _TextStats(WordCounter())
+        for chunk in _iter_chunks(_TextReader(text), 7):
+            stats.feed(chunk)
+        analysis = stats.result()
+
+        for key in ('word_count', 'sentence_count', 'paragraph_count', 'character_stats'):
+            self.assertEqual(analysis[key], expected[key])
+
+
+class CountCharactersTest(unittest.TestCase):
+    def test_non_ascii_bytes_match_counter_classification(self):
+        stats = WordCounter().count_characters(b'a\x85b\xa0 1.')
+
+        # 0x85 and 0xA0 are whitespace as characters, so only '.' is punctuation
+        self.assertEqual(stats['punctuation'], 1)
+        self.assertEqual(stats['alphabetic_chars'], 2)
+        self.assertEqual(stats['spaces'], 1)
+
+
+class AnalyzeTextCacheTest(unittest.TestCase):
+    def test_cache_hit_is_not_affected_by_caller_edits(self):
+        counter = WordCounter()
+        first = counter.analyze_text('apple apple pear')
+        first['word_frequency']['apple'] += 100
+        first['character_stats']['total_chars'] = 0
+
+        second = counter.analyze_text('apple apple pear')
+        self.assertEqual(second['word_frequency']['apple'], 2)
+        self.assertEqual(second['character_stats']['total_chars'], 16)
+
+
+class MostCommonWordsTest(unittest.TestCase):
+    def test_matches_counter_most_common_and_is_saved(self):
+        # Many words share a count, so the tie order is checked as well
+        text = 'kiwi fig plum fig lime pear kiwi date sloe yuzu pear lime ugli nut fig'
+        counter = WordCounter()
+        analysis = counter.analyze_text(text)
+        expected = Counter(text.split()).most_common(10)
+        self.assertEqual(analysis['most_common_words'], expected)
+
+        # A fresh result, so save_analysis has to build the lazy entry itself
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'analysis.json')
+            counter.save_analysis(WordCounter().analyze_text(text), path)
+            with open(path, encoding='utf-8') as file:
+                saved = json.load(file)
+        self.assertEqual(saved['most_common_words'], [list(item) for item in expected])
+
+
+class StopWordsTest(unittest.TestCase):
+    def test_custom_stop_words_are_used(self):
+        counter = WordCounter()
+        text = 'apple pear the apple'
+        self.assertIn('apple', counter.analyze_text(text, include_stop_words=False)['word_frequency'])
+
+        counter.stop_words = {'apple'}
+        analysis = counter.analyze_text(text, include_stop_words=False)
+        self.assertNotIn('apple', analysis['word_frequency'])
+        self.assertIn('the', analysis['word_frequency'])
+        self.assertEqual(counter.extract_words(text, include_stop_words=False), ['pear', 'the'])
+        self.assertEqual(counter.compare_texts(text, 'apple', include_stats=False)['common_words_count'], 0)
+
+
+
+class AnalyzeFilesTest(unittest.TestCase):
+    def test_merged_frequencies_match_per_file_analysis(self):
+        counter = WordCounter()
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('one.txt', 'two.txt')]
+            for path, text in zip(paths, ('The cat and the hat.\n', 'A cat, a dog and THE bird!\n')):
+                with open(path, 'w', encoding='utf-8') as file:
+                    file.write(text)
+
+            for include_stop_words in (True, False):
+                expected = Counter()
+                for path in paths:
+                    expected += counter.analyze_file(path, include_stop_words)['word_frequency']
+                merged = counter.analyze_files(paths, include_stop_words, workers=2)
+                self.assertEqual(merged, expected)
+
+            self.assertEqual(counter.analyze_files(paths, workers=2)['the'], 3)
+            self.assertNotIn('the', counter.analyze_files(paths, include_stop_words=False, workers=2))
+
+
+
+class ReadTextInputTest(unittest.TestCase):
+    def read(self, console):
+        stdin = io.StringIO(console)
+        with mock.patch('sys.stdin', stdin), mock.patch('sys.stdout', io.StringIO()):
+            return read_text_input('Enter text'), stdin
+
+    def test_two_blank_lines_end_the_text(self):
+        text, stdin = self.read('first line\n\nsecond paragraph\n\n\nmenu choice\n')
+
+        # A single blank line stays part of the text
+        self.assertEqual(text, 'first line\n\nsecond paragraph')
+        with mock.patch('sys.stdin', stdin), mock.patch('sys.stdout', io.StringIO()):
+            self.assertEqual(input(), 'menu choice')
+
+    def test_end_of_input_without_sentinel(self):
+        self.assertEqual(self.read('only line\n\n')[0], 'only line')
+        self.assertEqual(self.read('no newline')[0], 'no newline')
+        self.assertEqual(self.read('')[0], '')
+
+
+if __name__ == '__main__':
+    unittest.main()